@@ -10,18 +10,182 @@ Requirements:
     pip install boto3
 """
 
+from __future__ import annotations
+
 import argparse
+import asyncio
+import contextlib
+import functools
+import hashlib
+import io
+import logging
+import logging.handlers
 import sys
+import threading
 import time
-from typing import Optional
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import TYPE_CHECKING, Callable, Dict, Iterable, List, Optional, Set, Tuple
 
-import boto3
+# boto3, botocore.config and s3transfer take a few hundred milliseconds to
+# import, so they are imported where they are first used (keeps --help fast).
+# botocore.exceptions on its own is cheap.
 from botocore.exceptions import ClientError, BotoCoreError
 
+if TYPE_CHECKING:
+    from boto3.s3.transfer import TransferConfig
+    from botocore.config import Config
+
+
+# Progress is written straight to stdout, except during a concurrent test
+# phase: there it is buffered and written once the phase ends (or immediately
+# on an error), so the phase's tests don't contend on stdout. Handlers added
+# by an embedding caller are left alone.
+_log = logging.getLogger("s3proxy_test")
+_log.setLevel(logging.INFO)
+_log.propagate = False
+_stdout_handler = next((h for h in _log.handlers if h.get_name() == "s3proxy_stdout"), None)
+if _stdout_handler is None:
+    _stdout_handler = logging.StreamHandler(sys.stdout)
+    _stdout_handler.set_name("s3proxy_stdout")
+    _stdout_handler.setFormatter(logging.Formatter("%(message)s"))
+    _log.addHandler(_stdout_handler)
+
+_buffer_lock = threading.Lock()
+_buffer: Optional[logging.handlers.MemoryHandler] = None
+_buffer_depth = 0
+
+
+@contextlib.contextmanager
+def _buffered_log():
+    """Buffer stdout progress output until the block exits.
+
+    Overlapping phases (e.g. two testers in one process) share one buffer,
+    which is written when the last of them exits.
+    """
+    global _buffer, _buffer_depth
+    with _buffer_lock:
+        if _buffer_depth == 0 and _stdout_handler in _log.handlers:
+            _buffer = logging.handlers.MemoryHandler(capacity=1000, target=_stdout_handler)
+            _log.removeHandler(_stdout_handler)
+            _log.addHandler(_buffer)
+        _buffer_depth += 1
+    try:
+        yield
+    finally:
+        with _buffer_lock:
+            _buffer_depth -= 1
+            if _buffer_depth == 0 and _buffer is not None:
+                _log.removeHandler(_buffer)
+                _buffer.close()  # flushes to _stdout_handler
+                _log.addHandler(_stdout_handler)
+                _buffer = None
+
+
+# DeleteObjects accepts up to 1000 keys per request; 500 keeps each request
+# body small while still collapsing most cleanups into a single call.
+_DELETE_BATCH_SIZE = 500
+
+# Object bodies are read and verified in chunks of this size so memory use
+# stays bounded regardless of object size.
+_CHUNK_SIZE = 64 * 1024
+
+# Payloads at least this large are uploaded as parallel multipart parts.
+_MULTIPART_THRESHOLD = 8 << 20
+
+_EMPTY: dict = {}
+
+# Error codes meaning the endpoint does not route DeleteObjects at all (S3Proxy
+# answers 405 for POST /{bucket}?delete); only these fall back to DeleteObject.
+_DELETE_OBJECTS_UNSUPPORTED = frozenset({"405", "501", "MethodNotAllowed", "NotImplemented"})
+
+# Shared by every PUT instead of building a new dict per request.
+_PUT_METADATA = {"test-meta": "test-value"}
+
+_TEST_DATA = (
+    ("test1.txt", b"Hello, S3Proxy! This is test object 1."),
+    ("test2.txt", b"Hello, S3Proxy! This is test object 2 with some content."),
+    ("folder/test3.txt", b"Hello, S3Proxy! This is a nested object."),
+)
+
+
+def _err_code(e: ClientError) -> str:
+    """Return the S3 error code of a ClientError, or "Unknown"."""
+    return e.response.get("Error", _EMPTY).get("Code", "Unknown") if e.response else "Unknown"
+
+
+@functools.lru_cache(maxsize=None)
+def _transfer_config() -> TransferConfig:
+    """Return the multipart upload configuration."""
+    from boto3.s3.transfer import TransferConfig
+
+    return TransferConfig(
+        max_concurrency=8,
+        multipart_threshold=_MULTIPART_THRESHOLD,
+        multipart_chunksize=_MULTIPART_THRESHOLD,
+        use_threads=True,
+    )
+
+
+def _report_failure(action: str, key: str, e: ClientError) -> bool:
+    """Log a failed request for ``key`` and return False."""
+    _log.error("✗ Failed to %s %s: %s", action, key, e)
+    return False
+
+
+def _log_delete_failures(failed: Dict[str, str]) -> None:
+    """Log each key that a delete request reported as not deleted."""
+    for key, code in sorted(failed.items()):
+        _log.error("  ✗ Failed to delete %s: %s", key, code)
+
+
+def _client_config(config_cls: Optional[type] = None, unsigned: bool = False) -> Config:
+    """Build the client configuration shared by the sync and async testers.
+
+    Path-style addressing is always used because S3Proxy routes on
+    ``/{bucket}/{key}``.
+
+    Args:
+        config_cls: ``Config`` (default) or a subclass such as aiobotocore's
+            ``AioConfig``
+        unsigned: Skip SigV4 signing (S3Proxy itself does not verify
+            signatures); the credentials are then ignored
+
+    Returns:
+        Client configuration
+    """
+    from botocore import UNSIGNED
+    from botocore.config import Config
+
+    # Reuse pooled connections across calls and allow enough of them for
+    # concurrent requests, so each call doesn't pay a fresh handshake.
+    return (config_cls or Config)(
+        signature_version=UNSIGNED if unsigned else "s3v4",
+        s3={"addressing_style": "path"},
+        max_pool_connections=64,
+        tcp_keepalive=True,
+        retries={"max_attempts": 3, "mode": "standard"},
+    )
+
+
+def _unquote_etag(etag: str) -> str:
+    """Drop the surrounding quotes of an ETag, slicing only when present."""
+    if len(etag) >= 2 and etag[0] == '"' == etag[-1]:
+        return etag[1:-1]
+    return etag
+
+
+def _keep_alive(request, **kwargs):
+    """Ask S3Proxy to keep the connection open for the next request."""
+    request.headers["Connection"] = "keep-alive"
+
 
 class S3ProxyTester:
     """Test S3Proxy functionality using boto3."""
 
+    # Loading botocore's data files is the expensive part of creating a
+    # client, so every tester shares one session (created on first use).
+    _session = None
+
     def __init__(
         self,
         endpoint: str = "http://localhost:8080",
@@ -29,6 +193,8 @@ class S3ProxyTester:
         access_key: str = "minioadmin",
         secret_key: str = "minioadmin",
         region: str = "us-east-1",
+        verbose: bool = True,
+        unsigned: bool = False,
     ):
         """Initialize S3Proxy tester.
 
@@ -38,10 +204,60 @@ class S3ProxyTester:
             access_key: AWS access key (MinIO default: minioadmin)
             secret_key: AWS secret key (MinIO default: minioadmin)
             region: AWS region (required by boto3, but not used by S3Proxy)
+            verbose: Print per-object progress; failures and the summary are
+                always printed
+            unsigned: Send unsigned requests, ignoring the credentials
         """
         self.endpoint = endpoint
+        self.verbose = verbose
         self.bucket = bucket
-        self.s3_client = boto3.client(
+        self.unsigned = unsigned
+        self._client_args = (endpoint, access_key, secret_key, region, unsigned)
+        self.s3_client = self._make_client(*self._client_args)
+        self._transfer = None
+        self._transfer_lock = threading.Lock()
+        self.test_objects: Set[str] = set()
+        self._etag = {}
+
+    @staticmethod
+    @functools.lru_cache(maxsize=8)
+    def _make_client(
+        endpoint: str,
+        access_key: str,
+        secret_key: str,
+        region: str,
+        unsigned: bool = False,
+        probe: bool = False,
+    ):
+        """Create (or reuse) an S3 client for the given endpoint and credentials.
+
+        Args:
+            endpoint: S3Proxy endpoint URL
+            access_key: AWS access key
+            secret_key: AWS secret key
+            region: AWS region
+            unsigned: Send unsigned requests
+            probe: Build a readiness-probe client that makes a single attempt
+                with short timeouts instead of retrying
+
+        Returns:
+            Configured boto3 S3 client
+        """
+        import boto3
+        from botocore.config import Config
+
+        config = _client_config(unsigned=unsigned)
+        if probe:
+            config = config.merge(
+                Config(
+                    retries={"total_max_attempts": 1, "mode": "standard"},
+                    connect_timeout=1,
+                    read_timeout=5,
+                )
+            )
+        if S3ProxyTester._session is None:
+            S3ProxyTester._session = boto3.session.Session()
+        client = S3ProxyTester._session.client(
             "s3",
             endpoint_url=endpoint,
             aws_access_key_id=access_key,
@@ -49,48 +265,145 @@ class S3ProxyTester:
             region_name=region,
             use_ssl=False if endpoint.startswith("http://") else True,
             verify=False,  # Skip SSL verification for local testing
+            config=config,
         )
-        self.test_objects = []
+        client.meta.events.register("before-send.s3", _keep_alive)
+        return client
 
-    def wait_for_service(self, max_retries: int = 30, delay: int = 2) -> bool:
+    def wait_for_service(
+        self,
+        max_retries: int = 130,
+        delay: Optional[float] = None,
+        max_delay: float = 5.0,
+        timeout: float = 120.0,
+    ) -> bool:
         """Wait for S3Proxy service to be ready.
 
+        Unless ``delay`` is given, polls every 1ms..100ms (growing linearly)
+        for the first 100 attempts so an already-running service is detected
+        almost immediately, then backs off exponentially up to ``max_delay``
+        to tolerate slow starts. Each attempt is a single request with short
+        timeouts (no botocore retries), and the whole wait is bounded by
+        ``timeout``.
+
         Args:
             max_retries: Maximum number of retry attempts
-            delay: Delay between retries in seconds
+            delay: Fixed delay between retries in seconds (default: backoff)
+            max_delay: Upper bound on the backoff delay in seconds
+            timeout: Maximum total time to wait in seconds
 
         Returns:
             True if service is ready, False otherwise
         """
-        print(f"Waiting for S3Proxy at {self.endpoint}...")
+        _log.info("Waiting for S3Proxy at %s...", self.endpoint)
+        probe = self._make_client(*self._client_args, probe=True)
+        deadline = time.monotonic() + timeout
         for i in range(max_retries):
             try:
                 # Try to list buckets (this will fail if service is not ready)
-                self.s3_client.list_buckets()
-                print("✓ S3Proxy is ready!")
+                probe.list_buckets()
+                _log.info("✓ S3Proxy is ready!")
                 return True
             except (ClientError, BotoCoreError) as e:
-                if i < max_retries - 1:
-                    print(f"  Attempt {i+1}/{max_retries}: Service not ready, retrying in {delay}s...")
-                    time.sleep(delay)
+                if delay is not None:
+                    wait = delay
+                elif i < 100:
+                    wait = min(100, 1 + i) / 1000
                 else:
-                    print(f"✗ Service not ready after {max_retries} attempts: {e}")
+                    wait = min(max_delay, 0.1 * 1.5 ** (i - 100))
+                if i == max_retries - 1 or time.monotonic() + wait > deadline:
+                    _log.error("✗ Service not ready after %s attempts: %s", i + 1, e)
                     return False
+                if delay is not None or i >= 100:
+                    _log.info("  Attempt %s/%s: Service not ready, retrying in %.1fs...", i + 1, max_retries, wait)
+                time.sleep(wait)
+        return False
+
+    def _get_transfer(self):
+        """Create the multipart transfer manager on the first large PUT."""
+        with self._transfer_lock:
+            if self._transfer is None:
+                from boto3.s3.transfer import create_transfer_manager
+
+                self._transfer = create_transfer_manager(self.s3_client, _transfer_config())
+            return self._transfer
+
+    def _shutdown_transfer(self) -> None:
+        """Stop the transfer manager's worker threads, if one was created."""
+        with self._transfer_lock:
+            if self._transfer is not None:
+                self._transfer.shutdown()
+                self._transfer = None
+
+    # Bookkeeping and reporting shared by the sync and async per-object tests,
+    # so the two testers differ only in how the request is sent.
+
+    def _log_test(self, operation: str, key: str) -> None:
+        """Announce a per-object test."""
+        if self.verbose:
+            _log.info("\n[TEST] %s Object: s3://%s/%s", operation, self.bucket, key)
+
+    def _record_put(self, key: str, content: bytes, etag: Optional[str]) -> bool:
+        """Record a successful PUT and report it."""
+        if self.verbose:
+            _log.info("✓ Object uploaded successfully (size: %s bytes)", len(content))
+        self.test_objects.add(key)
+        # Multipart uploads report no ETag; forget any from an earlier PUT so
+        # the next GET is not conditioned on a stale value.
+        if etag:
+            self._etag[key] = etag
+        else:
+            self._etag.pop(key, None)
+        return True
+
+    def _get_kwargs(self, key: str, expected_etag: Optional[str]) -> dict:
+        """Build the get_object arguments, conditioned on the ETag if known."""
+        kwargs = {"Bucket": self.bucket, "Key": key}
+        if expected_etag:
+            kwargs["IfMatch"] = expected_etag
+        return kwargs
+
+    def _report_get(self, key: str, digest, size: int, expected_content: bytes) -> bool:
+        """Compare a downloaded body's MD5 against the expected content and report it."""
+        expected_md5 = hashlib.md5(expected_content).hexdigest()
+        if digest.hexdigest() == expected_md5:
+            if self.verbose:
+                _log.info("✓ Object downloaded successfully (size: %s bytes)", size)
+                _log.info("  Content matches: %s...", expected_content[:50].decode('utf-8', errors='ignore'))
+            return True
+        _log.error("✗ Content mismatch for %s!", key)
+        _log.error("  Expected: MD5 %s (%s bytes)", expected_md5, len(expected_content))
+        _log.error("  Got: MD5 %s (%s bytes)", digest.hexdigest(), size)
         return False
 
+    def _report_head(self, response: dict) -> bool:
+        """Report the metadata returned by HEAD."""
+        if self.verbose:
+            _log.info("✓ Object metadata retrieved successfully")
+            _log.info("  Size: %s bytes", response.get("ContentLength", 0))
+            _log.info("  ETag: %s", _unquote_etag(response.get("ETag", "")))
+        return True
+
+    def _record_delete(self, key: str) -> bool:
+        """Record a successful DELETE and report it."""
+        if self.verbose:
+            _log.info("✓ Object deleted successfully")
+        self.test_objects.discard(key)
+        return True
+
     def test_create_bucket(self) -> bool:
         """Test bucket creation."""
-        print("\n[TEST] Create Bucket")
+        _log.info("\n[TEST] Create Bucket")
         try:
             self.s3_client.create_bucket(Bucket=self.bucket)
-            print(f"✓ Bucket '{self.bucket}' created successfully")
+            _log.info("✓ Bucket '%s' created successfully", self.bucket)
             return True
         except ClientError as e:
-            error_code = e.response.get("Error", {}).get("Code", "Unknown")
+            error_code = _err_code(e)
             if error_code == "BucketAlreadyOwnedByYou":
-                print(f"✓ Bucket '{self.bucket}' already exists (expected)")
+                _log.info("✓ Bucket '%s' already exists (expected)", self.bucket)
                 return True
-            print(f"✗ Failed to create bucket: {e}")
+            _log.error("✗ Failed to create bucket: %s", e)
             return False
 
     def test_put_object(self, key: str, content: bytes) -> bool:
@@ -103,20 +416,28 @@ class S3ProxyTester:
         Returns:
             True if successful, False otherwise
         """
-        print(f"\n[TEST] PUT Object: s3://{self.bucket}/{key}")
+        self._log_test("PUT", key)
         try:
-            self.s3_client.put_object(
-                Bucket=self.bucket,
-                Key=key,
-                Body=content,
-                Metadata={"test-meta": "test-value"},
-            )
-            print(f"✓ Object uploaded successfully (size: {len(content)} bytes)")
-            self.test_objects.append(key)
-            return True
+            etag = None
+            if len(content) >= _MULTIPART_THRESHOLD:
+                self._get_transfer().upload(
+                    fileobj=io.BytesIO(content),
+                    bucket=self.bucket,
+                    key=key,
+                    extra_args={"Metadata": _PUT_METADATA},
+                ).result()
+            else:
+                response = self.s3_client.put_object(
+                    Bucket=self.bucket,
+                    Key=key,
+                    Body=content,
+                    Metadata=_PUT_METADATA,
+                )
+                etag = response.get("ETag")
+            return self._record_put(key, content, etag)
         except ClientError as e:
-            print(f"✗ Failed to upload object: {e}")
-            return False
+            self._etag.pop(key, None)
+            return _report_failure("upload object", key, e)
 
     def test_get_object(self, key: str, expected_content: bytes) -> bool:
         """Test object download (GET).
@@ -128,22 +449,40 @@ class S3ProxyTester:
         Returns:
             True if successful and content matches, False otherwise
         """
-        print(f"\n[TEST] GET Object: s3://{self.bucket}/{key}")
+        return self.test_verify_object(key, self._etag.get(key), expected_content)
+
+    def test_verify_object(
+        self, key: str, expected_etag: Optional[str], expected_content: bytes
+    ) -> bool:
+        """Test object download (GET) conditioned on the ETag returned by PUT.
+
+        A single ``If-Match`` GET both checks the object is unchanged (the
+        server answers 412 PreconditionFailed otherwise) and returns the body,
+        so no separate HEAD round trip is needed.
+
+        Args:
+            key: Object key
+            expected_etag: ETag returned by PUT, or None to skip the condition
+            expected_content: Expected object content
+
+        Returns:
+            True if successful and content matches, False otherwise
+        """
+        self._log_test("GET", key)
         try:
-            response = self.s3_client.get_object(Bucket=self.bucket, Key=key)
-            content = response["Body"].read()
-            if content == expected_content:
-                print(f"✓ Object downloaded successfully (size: {len(content)} bytes)")
-                print(f"  Content matches: {content[:50].decode('utf-8', errors='ignore')}...")
-                return True
-            else:
-                print(f"✗ Content mismatch!")
-                print(f"  Expected: {expected_content[:50]}")
-                print(f"  Got: {content[:50]}")
-                return False
+            response = self.s3_client.get_object(**self._get_kwargs(key, expected_etag))
+            body = response["Body"]
+            digest = hashlib.md5()
+            size = 0
+            try:
+                for chunk in body.iter_chunks(_CHUNK_SIZE):
+                    digest.update(chunk)
+                    size += len(chunk)
+            finally:
+                body.close()
+            return self._report_get(key, digest, size, expected_content)
         except ClientError as e:
-            print(f"✗ Failed to download object: {e}")
-            return False
+            return _report_failure("download object", key, e)
 
     def test_head_object(self, key: str) -> bool:
         """Test object metadata retrieval (HEAD).
@@ -154,18 +493,11 @@ class S3ProxyTester:
         Returns:
             True if successful, False otherwise
         """
-        print(f"\n[TEST] HEAD Object: s3://{self.bucket}/{key}")
+        self._log_test("HEAD", key)
         try:
-            response = self.s3_client.head_object(Bucket=self.bucket, Key=key)
-            size = response.get("ContentLength", 0)
-            etag = response.get("ETag", "").strip('"')
-            print(f"✓ Object metadata retrieved successfully")
-            print(f"  Size: {size} bytes")
-            print(f"  ETag: {etag}")
-            return True
+            return self._report_head(self.s3_client.head_object(Bucket=self.bucket, Key=key))
         except ClientError as e:
-            print(f"✗ Failed to retrieve object metadata: {e}")
-            return False
+            return _report_failure("retrieve metadata of object", key, e)
 
     def test_list_objects(self, prefix: Optional[str] = None) -> bool:
         """Test object listing (LIST).
@@ -176,20 +508,23 @@ class S3ProxyTester:
         Returns:
             True if successful, False otherwise
         """
-        print(f"\n[TEST] LIST Objects: s3://{self.bucket}/" + (f"{prefix}" if prefix else ""))
+        _log.info("\n[TEST] LIST Objects: s3://%s/%s", self.bucket, prefix or "")
         try:
-            kwargs = {"Bucket": self.bucket}
+            kwargs = {"Bucket": self.bucket, "PaginationConfig": {"PageSize": 1000}}
             if prefix:
                 kwargs["Prefix"] = prefix
 
-            response = self.s3_client.list_objects_v2(**kwargs)
-            objects = response.get("Contents", [])
-            print(f"✓ Listed {len(objects)} object(s)")
-            for obj in objects:
-                print(f"  - {obj['Key']} ({obj['Size']} bytes, modified: {obj['LastModified']})")
+            paginator = self.s3_client.get_paginator("list_objects_v2")
+            total = 0
+            for page in paginator.paginate(**kwargs):
+                for obj in page.get("Contents", ()):
+                    total += 1
+                    if self.verbose:
+                        _log.info("  - %s (%s bytes, modified: %s)", obj['Key'], obj['Size'], obj['LastModified'])
+            _log.info("✓ Listed %s object(s)", total)
             return True
         except ClientError as e:
-            print(f"✗ Failed to list objects: {e}")
+            _log.error("✗ Failed to list objects: %s", e)
             return False
 
     def test_delete_object(self, key: str) -> bool:
@@ -201,48 +536,130 @@ class S3ProxyTester:
         Returns:
             True if successful, False otherwise
         """
-        print(f"\n[TEST] DELETE Object: s3://{self.bucket}/{key}")
+        self._log_test("DELETE", key)
         try:
             self.s3_client.delete_object(Bucket=self.bucket, Key=key)
-            print(f"✓ Object deleted successfully")
-            if key in self.test_objects:
-                self.test_objects.remove(key)
-            return True
+            return self._record_delete(key)
         except ClientError as e:
-            print(f"✗ Failed to delete object: {e}")
-            return False
+            return _report_failure("delete object", key, e)
 
     def test_delete_bucket(self) -> bool:
         """Test bucket deletion."""
-        print(f"\n[TEST] Delete Bucket: {self.bucket}")
+        _log.info("\n[TEST] Delete Bucket: %s", self.bucket)
         try:
             # First, delete all objects in the bucket
-            response = self.s3_client.list_objects_v2(Bucket=self.bucket)
-            if "Contents" in response:
-                for obj in response["Contents"]:
-                    self.s3_client.delete_object(Bucket=self.bucket, Key=obj["Key"])
-                    print(f"  Deleted object: {obj['Key']}")
+            paginator = self.s3_client.get_paginator("list_objects_v2")
+            keys = [
+                obj["Key"]
+                for page in paginator.paginate(Bucket=self.bucket)
+                for obj in page.get("Contents", [])
+            ]
+            failed = self._delete_keys(keys)
+            if self.verbose:
+                for key in keys:
+                    if key not in failed:
+                        _log.info("  Deleted object: %s", key)
+            if failed:
+                _log_delete_failures(failed)
+                _log.error("✗ Failed to delete bucket: %s object(s) could not be deleted", len(failed))
+                return False
 
             self.s3_client.delete_bucket(Bucket=self.bucket)
-            print(f"✓ Bucket '{self.bucket}' deleted successfully")
+            _log.info("✓ Bucket '%s' deleted successfully", self.bucket)
             return True
         except ClientError as e:
-            error_code = e.response.get("Error", {}).get("Code", "Unknown")
+            error_code = _err_code(e)
             if error_code == "NoSuchBucket":
-                print(f"✓ Bucket '{self.bucket}' does not exist (expected)")
+                _log.info("✓ Bucket '%s' does not exist (expected)", self.bucket)
                 return True
-            print(f"✗ Failed to delete bucket: {e}")
+            _log.error("✗ Failed to delete bucket: %s", e)
             return False
 
+    def _delete_keys(self, keys: List[str], workers: int = 16) -> Dict[str, str]:
+        """Delete objects in concurrent batches using DeleteObjects.
+
+        Args:
+            keys: Object keys to delete
+            workers: Maximum number of batches deleted concurrently
+
+        Returns:
+            Error code for each key that could not be deleted
+        """
+        batches = [keys[i:i + _DELETE_BATCH_SIZE] for i in range(0, len(keys), _DELETE_BATCH_SIZE)]
+        failed: Dict[str, str] = {}
+        if len(batches) <= 1:
+            for batch in batches:
+                failed.update(self._delete_batch(batch))
+            return failed
+        with ThreadPoolExecutor(max_workers=min(workers, len(batches))) as executor:
+            for batch_failed in executor.map(self._delete_batch, batches):
+                failed.update(batch_failed)
+        return failed
+
+    def _delete_batch(self, batch: List[str]) -> Dict[str, str]:
+        """Delete up to one DeleteObjects request worth of keys.
+
+        Falls back to one DeleteObject call per key when the endpoint does
+        not support DeleteObjects (S3Proxy does not route it yet). Any other
+        error (e.g. AccessDenied, SlowDown) fails the whole batch with its code
+        rather than multiplying the failing requests.
+
+        Args:
+            batch: Object keys to delete
+
+        Returns:
+            Error code for each key that could not be deleted
+        """
+        try:
+            response = self.s3_client.delete_objects(
+                Bucket=self.bucket,
+                Delete={"Objects": [{"Key": key} for key in batch], "Quiet": True},
+            )
+        except ClientError as e:
+            code = _err_code(e)
+            if code not in _DELETE_OBJECTS_UNSUPPORTED:
+                return dict.fromkeys(batch, code)
+            failed = {}
+            for key in batch:
+                try:
+                    self.s3_client.delete_object(Bucket=self.bucket, Key=key)
+                except ClientError as e:
+                    failed[key] = _err_code(e)
+            return failed
+        return {err["Key"]: err.get("Code", "Unknown") for err in response.get("Errors", [])}
+
     def cleanup(self):
         """Clean up test objects."""
-        print("\n[CLEANUP] Removing test objects...")
-        for key in self.test_objects[:]:
-            try:
-                self.s3_client.delete_object(Bucket=self.bucket, Key=key)
-                print(f"  Deleted: {key}")
-            except ClientError:
-                pass
+        _log.info("\n[CLEANUP] Removing test objects...")
+        failed = self._delete_keys(list(self.test_objects))
+        for key in sorted(self.test_objects):
+            if key not in failed:
+                if self.verbose:
+                    _log.info("  Deleted: %s", key)
+                self.test_objects.discard(key)
+        _log_delete_failures(failed)
+
+    def _run_phase(
+        self,
+        name: str,
+        fn: Callable[..., bool],
+        items: Iterable[tuple],
+        workers: int = 16,
+    ) -> List[Tuple[str, bool]]:
+        """Run one test per item concurrently.
+
+        Args:
+            name: Phase name used to label each result (e.g. "PUT")
+            fn: Test method to call; each item is unpacked as its arguments
+            items: Argument tuples whose first element is the object key
+            workers: Maximum number of concurrent requests
+
+        Returns:
+            (test name, result) pairs in the order of ``items``
+        """
+        with _buffered_log(), ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [(f"{name} {args[0]}", executor.submit(fn, *args)) for args in items]
+            return [(label, future.result()) for label, future in futures]
 
     def run_all_tests(self, cleanup: bool = True) -> bool:
         """Run all S3Proxy tests.
@@ -253,112 +670,427 @@ class S3ProxyTester:
         Returns:
             True if all tests passed, False otherwise
         """
-        print("=" * 60)
-        print("S3Proxy Boto3 Test Suite")
-        print("=" * 60)
-        print(f"Endpoint: {self.endpoint}")
-        print(f"Bucket: {self.bucket}")
+        _log.info("=" * 60)
+        _log.info("S3Proxy Boto3 Test Suite")
+        _log.info("=" * 60)
+        _log.info("Endpoint: %s", self.endpoint)
+        _log.info("Bucket: %s", self.bucket)
 
         if not self.wait_for_service():
             return False
 
         tests = []
-        test_data = {
-            "test1.txt": b"Hello, S3Proxy! This is test object 1.",
-            "test2.txt": b"Hello, S3Proxy! This is test object 2 with some content.",
-            "folder/test3.txt": b"Hello, S3Proxy! This is a nested object.",
-        }
+        test_data = _TEST_DATA
 
         # Test 1: Create bucket
         tests.append(("Create Bucket", self.test_create_bucket()))
 
         # Test 2: PUT objects
-        for key, content in test_data.items():
-            tests.append((f"PUT {key}", self.test_put_object(key, content)))
+        tests.extend(self._run_phase("PUT", self.test_put_object, test_data))
 
         # Test 3: GET objects
-        for key, content in test_data.items():
-            tests.append((f"GET {key}", self.test_get_object(key, content)))
+        tests.extend(
+            self._run_phase(
+                "GET",
+                self.test_verify_object,
+                ((key, self._etag.get(key), content) for key, content in test_data),
+            )
+        )
 
         # Test 4: HEAD objects
-        for key in test_data.keys():
-            tests.append((f"HEAD {key}", self.test_head_object(key)))
+        tests.extend(self._run_phase("HEAD", self.test_head_object, ((key,) for key, _ in test_data)))
 
         # Test 5: LIST objects
         tests.append(("LIST all objects", self.test_list_objects()))
         tests.append(("LIST with prefix", self.test_list_objects(prefix="folder/")))
 
         # Test 6: DELETE objects
-        for key in test_data.keys():
-            tests.append((f"DELETE {key}", self.test_delete_object(key)))
+        tests.extend(self._run_phase("DELETE", self.test_delete_object, ((key,) for key, _ in test_data)))
 
         # Test 7: Delete bucket (optional)
         # tests.append(("Delete Bucket", self.test_delete_bucket()))
 
         if cleanup:
             self.cleanup()
+        self._shutdown_transfer()
 
         # Print summary
-        print("\n" + "=" * 60)
-        print("Test Summary")
-        print("=" * 60)
+        _log.info("\n" + "=" * 60)
+        _log.info("Test Summary")
+        _log.info("=" * 60)
         passed = sum(1 for _, result in tests if result)
         total = len(tests)
         for test_name, result in tests:
             status = "✓ PASS" if result else "✗ FAIL"
-            print(f"{status}: {test_name}")
+            _log.info("%s: %s", status, test_name)
 
-        print(f"\nTotal: {passed}/{total} tests passed")
+        _log.info("\nTotal: %s/%s tests passed", passed, total)
         if passed == total:
-            print("🎉 All tests passed!")
+            _log.info("🎉 All tests passed!")
             return True
         else:
-            print("❌ Some tests failed")
+            _log.error("❌ Some tests failed")
             return False
 
 
-def main():
-    """Main entry point."""
-    parser = argparse.ArgumentParser(description="Test S3Proxy with boto3")
-    parser.add_argument(
-        "--endpoint",
-        default="http://localhost:8080",
-        help="S3Proxy endpoint URL (default: http://localhost:8080)",
-    )
-    parser.add_argument(
-        "--bucket",
-        default="test-bucket",
-        help="Bucket name for testing (default: test-bucket)",
-    )
-    parser.add_argument(
-        "--access-key",
-        default="minioadmin",
-        help="AWS access key (default: minioadmin)",
-    )
-    parser.add_argument(
-        "--secret-key",
-        default="minioadmin",
-        help="AWS secret key (default: minioadmin)",
-    )
-    parser.add_argument(
-        "--region",
-        default="us-east-1",
-        help="AWS region (default: us-east-1)",
-    )
-    parser.add_argument(
-        "--no-cleanup",
-        action="store_true",
-        help="Don't clean up test objects after tests",
-    )
+class AsyncS3ProxyTester(S3ProxyTester):
+    """Test S3Proxy using aioboto3 for the per-object PUT/GET/HEAD/DELETE phases.
+
+    All requests of a phase are issued concurrently on one event loop with
+    ``asyncio.gather``. Bucket, LIST and cleanup steps reuse the synchronous
+    client from :class:`S3ProxyTester`.
+    """
+
+    def __init__(
+        self,
+        endpoint: str = "http://localhost:8080",
+        bucket: str = "test-bucket",
+        access_key: str = "minioadmin",
+        secret_key: str = "minioadmin",
+        region: str = "us-east-1",
+        verbose: bool = True,
+        unsigned: bool = False,
+    ):
+        """Initialize async S3Proxy tester (same arguments as S3ProxyTester)."""
+        super().__init__(endpoint, bucket, access_key, secret_key, region, verbose, unsigned)
+        self._client_kwargs = {
+            "endpoint_url": endpoint,
+            "aws_access_key_id": access_key,
+            "aws_secret_access_key": secret_key,
+            "region_name": region,
+            "use_ssl": False if endpoint.startswith("http://") else True,
+            "verify": False,  # Skip SSL verification for local testing
+        }
+        self._loop = None
+        self._async_client = None
+
+    def run_all_tests(self, cleanup: bool = True) -> bool:
+        """Run all S3Proxy tests with one aioboto3 client for the whole run.
 
-    args = parser.parse_args()
+        Args:
+            cleanup: Whether to clean up test objects after tests
+
+        Returns:
+            True if all tests passed, False otherwise
+        """
+        try:
+            import aioboto3
+            from aiobotocore.config import AioConfig
+        except ImportError:
+            _log.error("✗ --async-client requires aioboto3 (pip install aioboto3)")
+            return False
+
+        self._loop = asyncio.new_event_loop()
+        stack = contextlib.AsyncExitStack()
+        try:
+            self._async_client = self._loop.run_until_complete(
+                stack.enter_async_context(
+                    aioboto3.Session().client(
+                        "s3",
+                        **self._client_kwargs,
+                        config=_client_config(AioConfig, unsigned=self.unsigned),
+                    )
+                )
+            )
+            return super().run_all_tests(cleanup=cleanup)
+        finally:
+            self._loop.run_until_complete(stack.aclose())
+            self._loop.close()
+            self._loop = None
+            self._async_client = None
+
+    def _run_phase(
+        self,
+        name: str,
+        fn: Callable[..., bool],
+        items: Iterable[tuple],
+        workers: int = 16,
+    ) -> List[Tuple[str, bool]]:
+        """Run one test coroutine per item concurrently on the event loop.
+
+        Args:
+            name: Phase name used to label each result (e.g. "PUT")
+            fn: Test coroutine function; each item is unpacked as its arguments
+            items: Argument tuples whose first element is the object key
+            workers: Unused; concurrency is bounded by the connection pool
 
+        Returns:
+            (test name, result) pairs in the order of ``items``
+        """
+        items = list(items)
+
+        async def gather():
+            return await asyncio.gather(*(fn(*args) for args in items))
+
+        with _buffered_log():
+            results = self._loop.run_until_complete(gather())
+        return [(f"{name} {args[0]}", result) for args, result in zip(items, results)]
+
+    async def test_put_object(self, key: str, content: bytes) -> bool:
+        """Test object upload (PUT).
+
+        Args:
+            key: Object key
+            content: Object content
+
+        Returns:
+            True if successful, False otherwise
+        """
+        self._log_test("PUT", key)
+        try:
+            etag = None
+            if len(content) >= _MULTIPART_THRESHOLD:
+                await self._async_client.upload_fileobj(
+                    io.BytesIO(content),
+                    self.bucket,
+                    key,
+                    ExtraArgs={"Metadata": _PUT_METADATA},
+                    Config=_transfer_config(),
+                )
+            else:
+                response = await self._async_client.put_object(
+                    Bucket=self.bucket,
+                    Key=key,
+                    Body=content,
+                    Metadata=_PUT_METADATA,
+                )
+                etag = response.get("ETag")
+            return self._record_put(key, content, etag)
+        except ClientError as e:
+            self._etag.pop(key, None)
+            return _report_failure("upload object", key, e)
+
+    async def test_get_object(self, key: str, expected_content: bytes) -> bool:
+        """Test object download (GET).
+
+        Args:
+            key: Object key
+            expected_content: Expected object content
+
+        Returns:
+            True if successful and content matches, False otherwise
+        """
+        return await self.test_verify_object(key, self._etag.get(key), expected_content)
+
+    async def test_verify_object(
+        self, key: str, expected_etag: Optional[str], expected_content: bytes
+    ) -> bool:
+        """Test object download (GET) conditioned on the ETag returned by PUT.
+
+        Args:
+            key: Object key
+            expected_etag: ETag returned by PUT, or None to skip the condition
+            expected_content: Expected object content
+
+        Returns:
+            True if successful and content matches, False otherwise
+        """
+        self._log_test("GET", key)
+        try:
+            response = await self._async_client.get_object(**self._get_kwargs(key, expected_etag))
+            body = response["Body"]
+            digest = hashlib.md5()
+            size = 0
+            async with body:
+                async for chunk in body.iter_chunks(_CHUNK_SIZE):
+                    digest.update(chunk)
+                    size += len(chunk)
+            return self._report_get(key, digest, size, expected_content)
+        except ClientError as e:
+            return _report_failure("download object", key, e)
+
+    async def test_head_object(self, key: str) -> bool:
+        """Test object metadata retrieval (HEAD).
+
+        Args:
+            key: Object key
+
+        Returns:
+            True if successful, False otherwise
+        """
+        self._log_test("HEAD", key)
+        try:
+            return self._report_head(await self._async_client.head_object(Bucket=self.bucket, Key=key))
+        except ClientError as e:
+            return _report_failure("retrieve metadata of object", key, e)
+
+    async def test_delete_object(self, key: str) -> bool:
+        """Test object deletion (DELETE).
+
+        Args:
+            key: Object key
+
+        Returns:
+            True if successful, False otherwise
+        """
+        self._log_test("DELETE", key)
+        try:
+            await self._async_client.delete_object(Bucket=self.bucket, Key=key)
+            return self._record_delete(key)
+        except ClientError as e:
+            return _report_failure("delete object", key, e)
+
+
+def _run(
+    endpoint: str,
+    bucket: str,
+    access_key: str,
+    secret_key: str,
+    region: str,
+    cleanup: bool,
+    verbose: bool,
+    unsigned: bool,
+) -> bool:
+    """Build a tester and run the full suite (executed in a worker process)."""
     tester = S3ProxyTester(
+        endpoint=endpoint,
+        bucket=bucket,
+        access_key=access_key,
+        secret_key=secret_key,
+        region=region,
+        verbose=verbose,
+        unsigned=unsigned,
+    )
+    return tester.run_all_tests(cleanup=cleanup)
+
+
+def run_all_tests_isolated(
+    endpoint: str = "http://localhost:8080",
+    bucket: str = "test-bucket",
+    access_key: str = "minioadmin",
+    secret_key: str = "minioadmin",
+    region: str = "us-east-1",
+    cleanup: bool = True,
+    verbose: bool = True,
+    unsigned: bool = False,
+) -> bool:
+    """Run the full suite in a separate process.
+
+    Use this when embedding the tests in a long-running service: the blocking
+    boto3 calls and their session state stay in the worker process instead of
+    the caller's. This call itself blocks until the run finishes; from an
+    asyncio event loop use :func:`run_all_tests_isolated_async` instead.
+
+    Args:
+        endpoint: S3Proxy endpoint URL
+        bucket: Bucket name to use for testing
+        access_key: AWS access key
+        secret_key: AWS secret key
+        region: AWS region
+        cleanup: Whether to clean up test objects after tests
+        verbose: Print per-object progress
+        unsigned: Send unsigned requests, ignoring the credentials
+
+    Returns:
+        True if all tests passed, False otherwise
+    """
+    with ProcessPoolExecutor(max_workers=1) as executor:
+        return executor.submit(
+            _run, endpoint, bucket, access_key, secret_key, region, cleanup, verbose, unsigned
+        ).result()
+
+
+async def run_all_tests_isolated_async(
+    endpoint: str = "http://localhost:8080",
+    bucket: str = "test-bucket",
+    access_key: str = "minioadmin",
+    secret_key: str = "minioadmin",
+    region: str = "us-east-1",
+    cleanup: bool = True,
+    verbose: bool = True,
+    unsigned: bool = False,
+) -> bool:
+    """Run the full suite in a separate process without blocking the event loop.
+
+    Same arguments and result as :func:`run_all_tests_isolated`; the caller's
+    loop keeps serving other tasks while the worker process runs.
+    """
+    loop = asyncio.get_running_loop()
+    with ProcessPoolExecutor(max_workers=1) as executor:
+        return await loop.run_in_executor(
+            executor,
+            _run,
+            endpoint,
+            bucket,
+            access_key,
+            secret_key,
+            region,
+            cleanup,
+            verbose,
+            unsigned,
+        )
+
+
+_PARSER: Optional[argparse.ArgumentParser] = None
+
+
+def _get_parser() -> argparse.ArgumentParser:
+    """Build the command-line parser once and reuse it."""
+    global _PARSER
+    if _PARSER is None:
+        parser = argparse.ArgumentParser(description="Test S3Proxy with boto3")
+        parser.add_argument(
+            "--endpoint",
+            default="http://localhost:8080",
+            help="S3Proxy endpoint URL (default: http://localhost:8080)",
+        )
+        parser.add_argument(
+            "--bucket",
+            default="test-bucket",
+            help="Bucket name for testing (default: test-bucket)",
+        )
+        parser.add_argument(
+            "--access-key",
+            default="minioadmin",
+            help="AWS access key (default: minioadmin)",
+        )
+        parser.add_argument(
+            "--secret-key",
+            default="minioadmin",
+            help="AWS secret key (default: minioadmin)",
+        )
+        parser.add_argument(
+            "--unsigned",
+            action="store_true",
+            help="Send unsigned requests; --access-key/--secret-key are ignored",
+        )
+        parser.add_argument(
+            "--region",
+            default="us-east-1",
+            help="AWS region (default: us-east-1)",
+        )
+        parser.add_argument(
+            "--no-cleanup",
+            action="store_true",
+            help="Don't clean up test objects after tests",
+        )
+        parser.add_argument(
+            "--quiet",
+            action="store_true",
+            help="Only print failures and the test summary",
+        )
+        parser.add_argument(
+            "--async-client",
+            action="store_true",
+            help="Issue per-object requests concurrently with aioboto3 (requires aioboto3)",
+        )
+        _PARSER = parser
+    return _PARSER
+
+
+def main():
+    """Main entry point."""
+    args = _get_parser().parse_args()
+
+    tester_cls = AsyncS3ProxyTester if args.async_client else S3ProxyTester
+    tester = tester_cls(
         endpoint=args.endpoint,
         bucket=args.bucket,
         access_key=args.access_key,
         secret_key=args.secret_key,
         region=args.region,
+        verbose=not args.quiet,
+        unsigned=args.unsigned,
     )
 
     success = tester.run_all_tests(cleanup=not args.no_cleanup)